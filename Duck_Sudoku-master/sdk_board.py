@@ -11,7 +11,8 @@ from sdk_config import CHOICES, UNKNOWN, ROOT
 from sdk_config import NROWS, NCOLS
 
 import enum
-from typing import Sequence, List, Set
+from typing import Sequence, List, Set, FrozenSet, Iterable, Dict, Tuple
+from typing import Optional
 
 import logging
 logging.basicConfig()
@@ -19,6 +20,92 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
 
+# --------------------------------
+#  Candidate sets as bitmasks
+# --------------------------------
+# Bit i of a mask stands for the symbol CHOICES[i].
+# The solver works on masks; symbols are used only
+# at the edges (input, output, and the Tile API).
+
+BIT = {symbol: 1 << i for i, symbol in enumerate(CHOICES)}
+_INDEX = {symbol: i for i, symbol in enumerate(CHOICES)}
+ALL_CANDIDATES = (1 << len(CHOICES)) - 1
+# Indexes of the set bits, for every possible mask
+_BIT_INDEXES = [tuple(i for i in range(len(CHOICES)) if mask & (1 << i))
+                for mask in range(ALL_CANDIDATES + 1)]
+
+# Masks of positions within a group (see Board.group_digit_places).
+# Blocks are numbered row by row, as are positions within a block.
+# ROW_IN_BLOCK[i] / COL_IN_BLOCK[i]: positions of a block on its i'th
+# row / column.  SEGMENT[k]: positions of a row or column that lie in
+# its k'th block.
+ROW_IN_BLOCK = [((1 << ROOT) - 1) << (ROOT * i) for i in range(ROOT)]
+COL_IN_BLOCK = [sum(1 << (ROOT * r + i) for r in range(ROOT))
+                for i in range(ROOT)]
+SEGMENT = [((1 << ROOT) - 1) << (ROOT * k) for k in range(ROOT)]
+
+
+# --------------------------------
+#  Board layout
+# --------------------------------
+# The same for every board, so worked out once.
+# GROUP_INDICES[g] lists (row, col) of the tiles in group g;
+# the rows come first, then the columns, then the blocks
+# (row by row).  TILE_TO_GROUPS[(row, col)] gives
+# (group, position in group) for the row, column, and
+# block of that tile, in that order.
+
+def _group_indices() -> List[List[Tuple[int, int]]]:
+    rows = [[(row, col) for col in range(NCOLS)] for row in range(NROWS)]
+    cols = [[(row, col) for row in range(NROWS)] for col in range(NCOLS)]
+    blocks = [[(ROOT * block_row + row, ROOT * block_col + col)
+               for row in range(ROOT) for col in range(ROOT)]
+              for block_row in range(ROOT) for block_col in range(ROOT)]
+    return rows + cols + blocks
+
+
+def _tile_to_groups() -> Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]]:
+    memberships = { }
+    for g, group in enumerate(GROUP_INDICES):
+        for pos, addr in enumerate(group):
+            memberships.setdefault(addr, []).append((g, pos))
+    return {addr: tuple(m) for addr, m in memberships.items()}
+
+
+GROUP_INDICES = _group_indices()
+TILE_TO_GROUPS = _tile_to_groups()
+
+
+def to_mask(symbols: Iterable[str]) -> int:
+    """Mask with the bits of the given symbols set"""
+    mask = 0
+    for symbol in symbols:
+        mask |= BIT[symbol]
+    return mask
+
+
+def to_symbol(mask: int) -> str:
+    """The symbol of the highest bit in a non-empty mask;
+    for a single-bit mask, that is its only symbol.
+    """
+    return CHOICES[mask.bit_length() - 1]
+
+
+_ALL_CHOICES = frozenset(CHOICES)
+# Decoded masks are shared rather than rebuilt on each call
+_SYMBOL_SETS: Dict[int, FrozenSet[str]] = {ALL_CANDIDATES: _ALL_CHOICES}
+
+
+def to_symbols(mask: int) -> FrozenSet[str]:
+    """The set of symbols whose bits are set in mask"""
+    symbols = _SYMBOL_SETS.get(mask)
+    if symbols is None:
+        symbols = frozenset(
+            symbol for symbol in CHOICES if mask & BIT[symbol])
+        _SYMBOL_SETS[mask] = symbols
+    return symbols
+
+
 # --------------------------------
 #  The events for MVC
 # --------------------------------
@@ -54,6 +141,7 @@ class Listener(object):
 class EventKind(enum.Enum):
     TileChanged = 1
     TileGuessed = 2
+    PropagationComplete = 3
 
 
 class TileEvent(Event):
@@ -73,6 +161,19 @@ class TileEvent(Event):
         return f"{repr(self.tile)}"
 
 
+class BoardEvent(Event):
+    """Something that happened to the board as a whole,
+    such as a round of propagation finishing.
+    """
+
+    def __init__(self, board: 'Board', kind: EventKind):
+        self.board = board
+        self.kind = kind
+
+    def __str__(self):
+        return f"{self.kind.name}"
+
+
 class TileListener(Listener):
     def notify(self, event: TileEvent):
         raise NotImplementedError(
@@ -81,6 +182,7 @@ class TileListener(Listener):
 
 class Listenable:
     """Objects to which listeners (like a view component) can be attached"""
+    __slots__ = ('listeners',)
 
     def __init__(self):
         self.listeners = [ ]
@@ -89,10 +191,17 @@ class Listenable:
         self.listeners.append(listener)
 
     def notify_all(self, event: Event):
+        if not self.listeners:
+            return
         for listener in self.listeners:
             listener.notify(event)
 
 
+# While True, tiles do not notify their view listeners
+# (see Board.set_silent and Board.propagate)
+_silent = False
+
+
 # ----------------------------------------------
 #      Tile class
 # ----------------------------------------------
@@ -101,30 +210,66 @@ class Tile(Listenable):
     """One tile on the Sudoku grid.
     Public attributes (read-only): value, which will be either
     UNKNOWN or an element of CHOICES; candidates, which will
-    be a set drawn from CHOICES.  If value is an element of
+    be a (frozen) set drawn from CHOICES.  If value is an element of
     CHOICES,then candidates will be the singleton containing
     value.  If candidates is empty, then no tile value can
     be consistent with other tile values in the grid.
     value is a public read-only attribute; change it
     only through the access method set_value or indirectly
     through method remove_candidates.
+    Internally the candidates are kept in candidates_mask,
+    an int with bit i set iff CHOICES[i] is still possible.
     """
+    # A board has many tiles and the solver touches them constantly;
+    # fixed slots keep them small and their attributes quick to reach.
+    __slots__ = ('row', 'col', '_hash', 'board_listener', 'changed_event',
+                 'value', 'candidates_mask')
 
     def __init__(self, row: int, col: int, value=UNKNOWN):
         super().__init__()
-        assert value == UNKNOWN or value in CHOICES
+        assert value == UNKNOWN or value in BIT
         self.row = row
         self.col = col
+        self._hash = hash((row, col))
+        # The board's own bookkeeping; hears of every change,
+        # even when view listeners are silenced
+        self.board_listener: Optional[Listener] = None
+        # Events carry nothing but the tile and their kind,
+        # so each tile reuses one rather than making a new one
+        # for every change
+        self.changed_event = TileEvent(self, EventKind.TileChanged)
         self.set_value(value)
 
     def set_value(self, value: str):
-        if value in CHOICES:
+        if value in BIT:
             self.value = value
-            self.candidates = {value}
+            self.candidates_mask = BIT[value]
         else:
             self.value = UNKNOWN
-            self.candidates = set(CHOICES)
-        self.notify_all(TileEvent(self, EventKind.TileChanged))
+            self.candidates_mask = ALL_CANDIDATES
+        self.notify_all(self.changed_event)
+
+    def notify_all(self, event: Event):
+        """The board listener, if any, hears of every change;
+        the others not while silenced.
+        """
+        if self.board_listener is not None:
+            self.board_listener.notify(event)
+        if not _silent:
+            super().notify_all(event)
+
+    def restore(self, value: str, candidates_mask: int):
+        """Put back a value and candidates saved earlier
+        (see Board._rollback).
+        """
+        self.value = value
+        self.candidates_mask = candidates_mask
+        self.notify_all(self.changed_event)
+
+    @property
+    def candidates(self) -> FrozenSet[str]:
+        """The candidate symbols, decoded from candidates_mask"""
+        return to_symbols(self.candidates_mask)
 
     def __str__(self):
         return f"{self.value}"
@@ -134,29 +279,33 @@ class Tile(Listenable):
 
     def could_be(self, value: str) -> bool:
         """True iff value is a candidate value for this tile"""
-        return value in self.candidates
+        return bool(self.candidates_mask & BIT[value])
 
     def __hash__(self) -> int:
         """Hash on position only (not value)"""
-        return hash((self.row, self.col))
+        return self._hash
 
-    def remove_candidates(self, used_values: Set[str]) -> bool:
+    def remove_candidates(self, used_values: int) -> bool:
         """The used values cannot be a value of this unknown tile.
         We remove those possibilities from the list of candidates.
         If there is exactly one candidate left, we set the
         value of the tile.
+        used_values is a mask in the same form as candidates_mask
+        (see to_mask).
         Returns:  True means we eliminated at least one candidate,
         False means nothing changed (none of the 'used_values' was
         in our candidates set).
         """
-        new_candidates = self.candidates.difference(used_values)
-        if new_candidates == self.candidates:
+        new_candidates = self.candidates_mask & ~used_values
+        if new_candidates == self.candidates_mask:
             # Didn't remove any candidates
             return False
-        self.candidates = new_candidates
-        if len(self.candidates) == 1:
-            self.set_value(new_candidates.pop())
-        self.notify_all(TileEvent(self, EventKind.TileChanged))
+        self.candidates_mask = new_candidates
+        if new_candidates and not new_candidates & (new_candidates - 1):
+            # Exactly one bit left; set_value notifies
+            self.set_value(to_symbol(new_candidates))
+        else:
+            self.notify_all(self.changed_event)
         return True
 
 
@@ -166,107 +315,381 @@ class Tile(Listenable):
 # ------------------------------
 
 
-class Board(object):
-    """A board has a matrix of tiles"""
+class Status(enum.Enum):
+    """Outcome of Board.propagate"""
+    OK = 1        # No contradiction, but some tiles still unknown
+    DEAD = 2      # No solution from here
+    SOLVED = 3    # Every tile known, and no clashes
 
-    def __init__(self):
-        """The empty board"""
-        # Row/Column structure: Each row contains columns
-        self.tiles: List[List[Tile]] = [ ]
-        self.groups: List[List[Tile]] = [ ]
 
-        for row in range(NROWS):
-            cols = [ ]
-            for col in range(NCOLS):
-                cols.append(Tile(row, col))
-            self.tiles.append(cols)
+class _BoardListener(TileListener):
+    """Keeps the board's group caches in step with one tile.
+    Remembers what the tile looked like at the last
+    notification, so the board can be told what changed.
+    """
 
-        for row in self.tiles:
-            self.groups.append(row)
+    def __init__(self, board: 'Board'):
+        super().__init__()
+        self.board = board
+        self.value = UNKNOWN
+        self.mask = 0
 
-        for col in range(len(self.tiles[0])):
-            cols = []
-            for row in range(len(self.tiles)):
-                cols.append(self.tiles[row][col])
-            self.groups.append(cols)
+    def notify(self, event: TileEvent):
+        tile = event.tile
+        if tile.value == self.value and tile.candidates_mask == self.mask:
+            return
+        old_value, old_mask = self.value, self.mask
+        self.value, self.mask = tile.value, tile.candidates_mask
+        self.board._tile_changed(tile, old_value, old_mask)
+
+
+class Board(Listenable):
+    """A board has a matrix of tiles.
+    Board listeners hear of board-wide events
+    (see propagate); tile listeners of single tiles.
+    """
 
-        for block_row in range(ROOT):
-            for block_col in range(ROOT):
-                group = [ ]
-                for row in range(ROOT):
-                    for col in range(ROOT):
-                        row_addr = (ROOT * block_row) + row
-                        col_addr = (ROOT * block_col) + col
-                        group.append(self.tiles[row_addr][col_addr])
-                self.groups.append(group)
+    def __init__(self):
+        """The empty board"""
+        super().__init__()
+        self._propagated_event = BoardEvent(
+            self, EventKind.PropagationComplete)
+        # Row/Column structure: Each row contains columns
+        self.tiles: List[List[Tile]] = [
+            [Tile(row, col) for col in range(NCOLS)] for row in range(NROWS)]
+        self.groups: List[List[Tile]] = [
+            [self.tiles[row][col] for row, col in group]
+            for group in GROUP_INDICES]
+
+        # Incremental bookkeeping, so that the tactics look only
+        # at groups that changed since they last ran.
+        # tile_groups[tile] lists (group index, position in group)
+        # for the three groups a tile belongs to.
+        self.tile_groups: Dict[Tile, Tuple[Tuple[int, int], ...]] = {
+            tile: TILE_TO_GROUPS[(tile.row, tile.col)]
+            for row in self.tiles for tile in row}
+        # Every tile with its row, column, and block group, row by row
+        self.cells: List[Tuple[Tile, int, int, int]] = [
+            (tile, *(g for g, _ in self.tile_groups[tile]))
+            for row in self.tiles for tile in row]
+        # group_used[g] is the mask of values placed in group g;
+        # group_digit_places[g][d] has bit pos set iff CHOICES[d] is
+        # a candidate of the tile at position pos of group g.
+        self.group_used: List[int] = [0] * len(self.groups)
+        self.group_digit_places: List[List[int]] = [
+            [0] * len(CHOICES) for _ in self.groups]
+        # group_counts[g][d] is how many tiles of group g hold CHOICES[d]
+        self.group_counts: List[List[int]] = [
+            [0] * len(CHOICES) for _ in self.groups]
+        # Running totals, so propagate can tell a dead end or a
+        # solution without another sweep: groups holding a value
+        # twice, unknown tiles with no candidates left, and unknown
+        # tiles.  The tile listeners below start out with every tile
+        # seen as UNKNOWN and without candidates.
+        self._clashes = 0
+        self._empty_tiles = NROWS * NCOLS
+        self._unsolved_count = NROWS * NCOLS
+        # Groups that naked_single / hidden_single must revisit
+        self._naked_dirty: Set[int] = set()
+        self._hidden_dirty: Set[int] = set()
+        # Tiles changed since the last flush_events
+        self._changed_tiles: Set[Tile] = set()
+        # Undo log for guessing: (tile, old value, old mask) for
+        # each change made since the earliest open checkpoint;
+        # a checkpoint is a length of the journal.
+        self._journal: List[Tuple[Tile, str, int]] = [ ]
+        self._checkpoints: List[int] = [ ]
+        self._rolling_back = False
+        for row in self.tiles:
+            for tile in row:
+                listener = _BoardListener(self)
+                listener.notify(tile.changed_event)
+                tile.board_listener = listener
+        self._changed_tiles.clear()
+
+    def _tile_changed(self, tile: Tile,
+                      old_value: str, old_mask: int):
+        """Bring the group caches up to date with a change
+        to tile, and mark its groups for another look.
+        """
+        if self._checkpoints and not self._rolling_back:
+            self._journal.append((tile, old_value, old_mask))
+        self._changed_tiles.add(tile)
+        value, mask = tile.value, tile.candidates_mask
+        removed = _BIT_INDEXES[old_mask & ~mask]
+        added = _BIT_INDEXES[mask & ~old_mask]
+        placed = value != old_value
+        if placed:
+            if old_value == UNKNOWN:
+                self._unsolved_count -= 1
+            elif value == UNKNOWN:
+                self._unsolved_count += 1
+        self._empty_tiles += ((value == UNKNOWN and not mask)
+                              - (old_value == UNKNOWN and not old_mask))
+        digit_places = self.group_digit_places
+        naked_dirty = self._naked_dirty
+        hidden_dirty = self._hidden_dirty
+        for g, pos in self.tile_groups[tile]:
+            hidden_dirty.add(g)
+            places = digit_places[g]
+            here = 1 << pos
+            for d in removed:
+                places[d] &= ~here
+            if added:
+                # Candidates came back; they may need crossing off again
+                naked_dirty.add(g)
+                for d in added:
+                    places[d] |= here
+            if placed:
+                counts = self.group_counts[g]
+                if old_value != UNKNOWN:
+                    d = _INDEX[old_value]
+                    counts[d] -= 1
+                    if counts[d] == 1:
+                        self._clashes -= 1
+                    elif counts[d] == 0:
+                        self.group_used[g] &= ~BIT[old_value]
+                if value != UNKNOWN:
+                    d = _INDEX[value]
+                    counts[d] += 1
+                    if counts[d] == 2:
+                        self._clashes += 1
+                    self.group_used[g] |= mask
+                naked_dirty.add(g)
 
     def solve(self) -> bool:
         """General solver; guess-and-check
         combined with constraint propagation.
         """
-        self.propagate()
-        if not self.is_consistent():
+        status = self.propagate()
+        if status == Status.DEAD:
             return False
-        if self.is_complete():
+        if status == Status.SOLVED:
             return True
         else:
-            save = self.as_list()
             tile = self.min_choice_tile()
             for value in CHOICES:
+                if not tile.could_be(value):
+                    # Would clash with a value already placed
+                    continue
+                self._checkpoints.append(len(self._journal))
                 tile.set_value(value)
                 if self.solve():
+                    self._checkpoints.pop()
+                    if not self._checkpoints:
+                        self._journal.clear()
                     return True
                 else:
-                    self.set_tiles(save)
+                    self._rollback()
         return False
 
-
-    def propagate(self):
+    def _rollback(self):
+        """Undo every change since the last checkpoint,
+        most recent first.  The checkpoint is always taken
+        after propagate has finished, so nothing is left
+        for the tactics to revisit.
+        """
+        mark = self._checkpoints.pop()
+        journal = self._journal
+        was_silent = _silent
+        self.set_silent(True)
+        self._rolling_back = True
+        try:
+            while len(journal) > mark:
+                tile, value, mask = journal.pop()
+                tile.restore(value, mask)
+        finally:
+            self._rolling_back = False
+            self.set_silent(was_silent)
+        self._naked_dirty.clear()
+        self._hidden_dirty.clear()
+        self.flush_events()
+
+
+    def propagate(self) -> 'Status':
         """Repeat solution tactics until we
         don't make any progress, whether or not
-        the board is solved.
+        the board is solved, or until we find a
+        contradiction.
+        Tile listeners are not told of the individual
+        steps; instead board listeners get a single
+        PropagationComplete event at the end.
+        """
+        was_silent = _silent
+        self.set_silent(True)
+        try:
+            progress = True
+            while progress and not self._is_dead():
+                progress = self.naked_single()
+                progress = self.hidden_single() or progress
+                if not progress:
+                    progress = self.locked_candidates()
+                if not progress:
+                    progress = self.naked_pairs()
+        finally:
+            self.set_silent(was_silent)
+        self._changed_tiles.clear()
+        if not _silent:
+            self.notify_all(self._propagated_event)
+        if self._is_dead():
+            return Status.DEAD
+        if self._unsolved_count == 0:
+            return Status.SOLVED
+        return Status.OK
+
+    def _is_dead(self) -> bool:
+        """Some group holds a value twice, or some
+        unknown tile has run out of candidates.
+        """
+        return bool(self._clashes or self._empty_tiles)
+
+    @staticmethod
+    def set_silent(silent: bool):
+        """Turn notification of view listeners off (True) or
+        back on (False).  This applies to all tiles of all boards.
+        Board bookkeeping is not affected.
+        """
+        global _silent
+        _silent = silent
+
+    def flush_events(self):
+        """Notify view listeners of tiles changed since the
+        last flush, once per tile.  Nothing is sent while silenced.
         """
-        progress = True
-        while progress:
-            progress = self.naked_single()
-            self.hidden_single()
-        return
+        changed, self._changed_tiles = self._changed_tiles, set()
+        if _silent or not changed:
+            return
+        for row in self.tiles:
+            for tile in row:
+                if tile in changed and tile.listeners:
+                    tile.notify_all(tile.changed_event)
 
     def naked_single(self) -> bool:
         """Eliminate candidates and check for sole remaining possibilities.
+        Each unknown tile in a group where a value was placed since
+        the last call loses, at once, the values used in any of its
+        three groups.
         Return value True means we crossed off at least one candidate.
         Return value False means we made no progress.
         """
         progress = False
-        for group in self.groups:
-            used = set()
-            for tile in group:
-                if tile.value != UNKNOWN:
-                    used.add(tile.value)
-            for tile in group:
-                if tile.remove_candidates(used):
+        dirty, self._naked_dirty = self._naked_dirty, set()
+        if not dirty:
+            return False
+        used = self.group_used
+        for tile, row, col, block in self.cells:
+            if tile.value == UNKNOWN and (
+                    row in dirty or col in dirty or block in dirty):
+                if tile.remove_candidates(used[row] | used[col] | used[block]):
                     progress = True
         return progress
 
-    def hidden_single(self):
+    def hidden_single(self) -> bool:
+        """Place any value that has only one possible tile in a group.
+        Only groups that changed since the last call are visited.
+        """
+        progress = False
+        dirty, self._hidden_dirty = self._hidden_dirty, set()
+        for g in sorted(dirty):
+            group = self.groups[g]
+            places = self.group_digit_places[g]
+            for d, symbol in enumerate(CHOICES):
+                where = places[d]
+                if (where and not where & (where - 1)
+                        and not self.group_used[g] & BIT[symbol]):
+                    tile = group[where.bit_length() - 1]
+                    if tile.value == UNKNOWN:
+                        tile.set_value(symbol)
+                        progress = True
+        return progress
+
+    def locked_candidates(self) -> bool:
+        """If within a block a value can only go on one row
+        (or column), it cannot go anywhere else on that row
+        (column) ("pointing").  Likewise, if within a row or
+        column a value can only go in one block, it cannot go
+        anywhere else in that block ("claiming").
+        Return value True means we crossed off at least one candidate.
+        """
+        progress = False
+        first_col = NROWS
+        first_block = NROWS + NCOLS
+        for block_row in range(ROOT):
+            for block_col in range(ROOT):
+                g = first_block + ROOT * block_row + block_col
+                places = self.group_digit_places[g]
+                for d in _BIT_INDEXES[ALL_CANDIDATES & ~self.group_used[g]]:
+                    where = places[d]
+                    if not where:
+                        continue
+                    for i in range(ROOT):
+                        if not where & ~ROW_IN_BLOCK[i]:
+                            row = ROOT * block_row + i
+                            if self._eliminate(row, d, ~SEGMENT[block_col]):
+                                progress = True
+                        if not where & ~COL_IN_BLOCK[i]:
+                            col = first_col + ROOT * block_col + i
+                            if self._eliminate(col, d, ~SEGMENT[block_row]):
+                                progress = True
+        for g in range(NROWS + NCOLS):
+            is_row = g < first_col
+            line = g if is_row else g - first_col
+            places = self.group_digit_places[g]
+            for d in _BIT_INDEXES[ALL_CANDIDATES & ~self.group_used[g]]:
+                where = places[d]
+                if not where:
+                    continue
+                for k in range(ROOT):
+                    if not where & ~SEGMENT[k]:
+                        if is_row:
+                            block = ROOT * (line // ROOT) + k
+                            keep = ROW_IN_BLOCK[line % ROOT]
+                        else:
+                            block = ROOT * k + line // ROOT
+                            keep = COL_IN_BLOCK[line % ROOT]
+                        if self._eliminate(first_block + block, d, ~keep):
+                            progress = True
+        return progress
+
+    def naked_pairs(self) -> bool:
+        """If two unknown tiles of a group have the same two
+        candidates, those two values must go in those two tiles,
+        so no other tile of the group can hold either.
+        Return value True means we crossed off at least one candidate.
+        """
         progress = False
         for group in self.groups:
-            leftovers = set(CHOICES)
+            # Tiles seen so far with exactly two candidates, by mask
+            pairs: Dict[int, Tile] = { }
             for tile in group:
-                if tile.value in CHOICES:
-                    leftovers.discard(tile.value)
-            for value in leftovers:
-                count = 0
-                empty = []
-                for tile in group:
-                    if value in tile.candidates:
-                        count += 1
-                        empty.append(tile)
-                if count == 1:
-                    empty[0].set_value(value)
-                    progress = True
+                mask = tile.candidates_mask
+                if tile.value != UNKNOWN or mask.bit_count() != 2:
+                    continue
+                partner = pairs.setdefault(mask, tile)
+                if partner is tile:
+                    continue
+                for other in group:
+                    if (other.value == UNKNOWN
+                            and other is not tile and other is not partner
+                            and other.remove_candidates(mask)):
+                        progress = True
         return progress
 
+    def _eliminate(self, g: int, d: int, positions: int) -> bool:
+        """Cross CHOICES[d] off the tiles at the given
+        positions of group g.  True if any changed.
+        """
+        where = self.group_digit_places[g][d] & positions
+        if not where:
+            return False
+        group = self.groups[g]
+        changed = False
+        for pos in _BIT_INDEXES[where]:
+            tile = group[pos]
+            if tile.value == UNKNOWN and tile.remove_candidates(1 << d):
+                changed = True
+        return changed
+
     def min_choice_tile(self) -> Tile:
         """Returns a tile with value UNKNOWN and
         minimum number of candidates.
@@ -274,13 +697,17 @@ class Board(object):
         with value UNKNOWN.
         """
         minimum = None
-        minimum_count = 10
-        for tile in self.tiles:
-            for group in tile:
-                if group.value == UNKNOWN:
-                    if len(group.candidates) < minimum_count:
-                        minimum = group
-                        minimum_count = len(group.candidates)
+        minimum_count = len(CHOICES) + 1
+        for tile, _, _, _ in self.cells:
+            if tile.value == UNKNOWN:
+                count = tile.candidates_mask.bit_count()
+                if count < minimum_count:
+                    minimum = tile
+                    minimum_count = count
+                    if count <= 2:
+                        # A single would have been placed already,
+                        # so only a dead end could do better
+                        break
         return minimum
 
     def is_complete(self) -> bool:
@@ -288,12 +715,11 @@ class Board(object):
         Note: Does not check consistency; do that
         separately with is_consistent.
         """
-        progress = True
-        for group in self.groups:
-            for tile in group:
+        for row in self.tiles:
+            for tile in row:
                 if tile.value == UNKNOWN:
-                    progress = False
-        return progress
+                    return False
+        return True
 
     def __str__(self) -> str:
         """In Sadman Sudoku format"""
@@ -310,25 +736,34 @@ class Board(object):
         return row_syms
 
     def set_tiles(self, tile_values: Sequence[Sequence[str]]):
-        """Set the tile values a list of lists or a list of strings"""
-        for row_num in range(NROWS):
-            for col_num in range(NCOLS):
-                tile = self.tiles[row_num][col_num]
-                tile.set_value(tile_values[row_num][col_num])
+        """Set the tile values a list of lists or a list of strings.
+        View listeners hear of each changed tile once, at the end.
+        """
+        was_silent = _silent
+        self.set_silent(True)
+        try:
+            for row_num in range(NROWS):
+                for col_num in range(NCOLS):
+                    tile = self.tiles[row_num][col_num]
+                    tile.set_value(tile_values[row_num][col_num])
+        finally:
+            self.set_silent(was_silent)
+        self.flush_events()
 
     def is_consistent(self) -> bool:
+        """No group holds the same value twice.
+        For each group we OR together the bits of the
+        known tiles' values; a repeated value shows up as
+        fewer bits than known tiles.
+        """
         for group in self.groups:
-            used_symbols = set()
+            used = 0
+            count = 0
             for tile in group:
-                if tile.value in CHOICES:
-                    if tile.value in used_symbols:
-                        log.debug(f"Duplicate {tile.value} in {group}")
-                        return False
-                    else:
-                        used_symbols.add(tile.value)
+                if tile.value != UNKNOWN:
+                    used |= BIT[tile.value]
+                    count += 1
+            if used.bit_count() != count:
+                log.debug(f"Duplicate value in {group}")
+                return False
         return True
-
-
-
-
-
@@ -5,6 +5,8 @@ on the game, such as the dimension (9x9 vs 16x16, etc),
 symbols, etc.
 """
 
+import sys
+
 # ---------  Configuration of the model component ----------
 # Dimension of board.  In principle we could
 # do 9x9, 16x16, 25x25, etc.
@@ -17,15 +19,16 @@ NBLOCKS = ROOT * ROOT
 
 # The set of symbols we can use must
 # be the same as the number of rows, columns,
-# and blocks.
-CHOICES = "123456789"
+# and blocks.  Symbols are interned so that the
+# solver's comparisons and lookups stay cheap.
+CHOICES = tuple(sys.intern(symbol) for symbol in "123456789")
 PENCIL = ["123", "456", "789"]
 # For 16x16, it would be
-#CHOICES =  "0123456789ABCDEF"
+#CHOICES = tuple(sys.intern(symbol) for symbol in "0123456789ABCDEF")
 #PENCIL = ["0123", "4567", "890A", "BCDE"]
 
 # One symbol, not in Choices, for Unknown
-UNKNOWN = "."
+UNKNOWN = sys.intern(".")
 
 # ---------- Configuration of the graphical view component ---
 
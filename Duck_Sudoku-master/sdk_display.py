@@ -33,9 +33,13 @@ logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
+# Pencil mark layout: sub-cell row, sub-cell column, symbol, and the
+# symbol's bit in a tile's candidates_mask
+_PENCIL_BITS = [(i, j, PENCIL[i][j], sdk_board.BIT[PENCIL[i][j]])
+                for i in range(ROOT) for j in range(ROOT)]
 
 
-class Board(object):
+class Board(sdk_board.Listener):
     """View of board.Board"""
 
     def __init__(self, model: sdk_board.Board, width: int, height: int):
@@ -45,12 +49,21 @@ class Board(object):
         self.model = model
         self.grid = graphics.grid.Grid(width, height, NROWS, NCOLS,
                                            title="Duck Sudoku")
-        # We don't actually listen to the model board; each individual tile view
-        # listens to its own model tile
+        # Pencil marks go in a ROOT x ROOT grid within each cell
+        self.grid.sub_grid_dim(ROOT, ROOT)
+        # Each individual tile view listens to its own model tile;
+        # we listen to the model board to catch up after propagation,
+        # which does not notify the tiles step by step
         self.tiles = [ ]
         for row in model.tiles:
             for tile in row:
                 self.tiles.append(Tile(self.grid, tile))
+        self.model.add_listener(self)
+
+    def notify(self, event: sdk_board.BoardEvent):
+        if event.kind == EventKind.PropagationComplete:
+            for tile in self.tiles:
+                tile.refresh()
 
     def close(self):
         self.grid.close( )
@@ -68,18 +81,27 @@ class Tile(sdk_board.TileListener):
         self.row = model.row
         self.col = model.col
         self.scan = scan
-        self.grid.sub_grid_dim(ROOT,ROOT)
-        self._update(sdk_board.TileEvent(self.model, EventKind.TileChanged))
+        # (value, candidates_mask) as last drawn
+        self._shown = None
+        self._update(self.model.changed_event)
         self.model.add_listener(self)
 
     def _update(self, event: sdk_board.TileEvent):
-        # Color code the tiles to indicate groups and status
         if event.kind == EventKind.TileChanged:
-            self._color_by_status()
-            self._label()
+            self.refresh()
         else:
             raise ValueError("Unanticipated event type")
 
+    def refresh(self):
+        """Redraw, unless the model tile is as we last drew it"""
+        shown = (self.model.value, self.model.candidates_mask)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        # Color code the tiles to indicate groups and status
+        self._color_by_status()
+        self._label()
+
     def _color_by_status(self):
         if self.model.value == UNKNOWN:
             self.grid.fill_cell(self.row, self.col, COLOR_UNKNOWN)
@@ -98,11 +120,10 @@ class Tile(sdk_board.TileListener):
         choice for a tile value.  We mark the possible choices in a 
         grid, leaving a blank for others.
         """
-        for i in range(ROOT):
-            for j in range(ROOT):
-                    if self.model.could_be(PENCIL[i][j]):
-                        self.grid.sub_label_cell(self.row, self.col,
-                                                     i, j, PENCIL[i][j])
+        candidates = self.model.candidates_mask
+        for i, j, symbol, bit in _PENCIL_BITS:
+            if candidates & bit:
+                self.grid.sub_label_cell(self.row, self.col, i, j, symbol)
 
 
     def notify(self, event: sdk_board.TileEvent):
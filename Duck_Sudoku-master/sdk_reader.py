@@ -35,20 +35,21 @@ def read(f: Union[IOBase, str],
         log.debug(f"Reading from file {f}")
     if board is None:
         board = sdk_board.Board()
-    values = []
-    for row in f:
-        row = row.strip()
-        log.debug(f"Reading row |{row}|")
-        values.append(row)
+    try:
+        data = f.read()
+    finally:
+        f.close()
+    # Blank lines (e.g., a trailing one) are not part of the puzzle
+    values = [row.strip() for row in data.splitlines() if row.strip()]
+    log.debug(f"Read values: {values}")
+    for row in values:
         if len(row) != NROWS:
             raise InputError("Puzzle row wrong length: {}"
                              .format(row))
-    log.debug(f"Read values: {values}")
     if len(values) != NROWS:
         raise InputError("Wrong number of rows in {}"
                          .format(values))
     board.set_tiles(values)
-    f.close()
     return board
 
 
@@ -1,6 +1,7 @@
 """Test cases for sdk.py"""
 
 import unittest
+import io
 from sdk_board import *
 from sdk_config import *
 import sdk_reader
@@ -26,6 +27,15 @@ class TestTileBasic(unittest.TestCase):
         self.assertEqual(repr(tile), "Tile(5, 7, '9')")
         self.assertEqual(str(tile), "9")
 
+    def test_remove_candidates(self):
+        tile = Tile(1, 1, UNKNOWN)
+        self.assertTrue(tile.remove_candidates(to_mask("1234")))
+        self.assertEqual(tile.candidates, set("56789"))
+        self.assertFalse(tile.remove_candidates(to_mask("13")))
+        self.assertTrue(tile.remove_candidates(to_mask("5678")))
+        self.assertEqual(tile.value, "9")
+        self.assertEqual(tile.candidates, {"9"})
+
 
 class TestBoardBuild(unittest.TestCase):
 
@@ -59,6 +69,16 @@ class TestBoardIO(unittest.TestCase):
         self.assertEqual(as_printed,
             "32...14..\n9..4.2..3\n..6.7...9\n8.1..5...\n...1.6...\n...7..1.8\n1...9.5..\n2..8.4..7\n..45...31")
 
+    def test_read_skips_blank_lines(self):
+        board = sdk_reader.read(open("data/complete.sdk"))
+        self.assertTrue(board.is_complete())
+
+    def test_read_bad_row(self):
+        f = io.StringIO("\n".join(["........."] * 8 + [".........."]))
+        with self.assertRaises(sdk_reader.InputError):
+            sdk_reader.read(f)
+        self.assertTrue(f.closed)
+
 
 class TestBoardGroups(unittest.TestCase):
 
@@ -90,6 +110,82 @@ class TestBoardGroups(unittest.TestCase):
                              msg=f"Oh no, group {group} is a duplicate!")
             groups_by_hash[hash_sum] = group
 
+    def test_group_caches_follow_tiles(self):
+        board = Board()
+        board.set_tiles(["12.......", ".........", ".........",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        self.assertEqual(board.group_used[0], to_mask("12"))
+        board.tiles[0][2].remove_candidates(to_mask("3"))
+        places = board.group_digit_places[0]
+        self.assertEqual(places[CHOICES.index("3")], 0b111111000)
+        self.assertEqual(places[CHOICES.index("1")], 0b111111101)
+        board.tiles[0][0].set_value(UNKNOWN)
+        self.assertEqual(board.group_used[0], to_mask("2"))
+
+
+
+class CountingListener(TileListener):
+    def __init__(self):
+        super().__init__()
+        self.counts = { }
+
+    def notify(self, event: TileEvent):
+        self.counts[event.tile] = self.counts.get(event.tile, 0) + 1
+
+
+class RecordingListener(Listener):
+    def __init__(self):
+        super().__init__()
+        self.events = [ ]
+
+    def notify(self, event: Event):
+        self.events.append(event)
+
+
+class TestEvents(unittest.TestCase):
+
+    def test_propagate_notifies_board_once(self):
+        board = Board()
+        board.set_tiles(["...26.7.1", "68..7..9.", "19...45..",
+                         "82.1...4.", "..46.29..", ".5...3.28",
+                         "..93...74", ".4..5..36", "7.3.18..."])
+        tile_listener = CountingListener()
+        for row in board.tiles:
+            for tile in row:
+                tile.add_listener(tile_listener)
+        board_listener = RecordingListener()
+        board.add_listener(board_listener)
+        board.propagate()
+        self.assertTrue(board.is_complete())
+        self.assertEqual(tile_listener.counts, { })
+        self.assertEqual([event.kind for event in board_listener.events],
+                         [EventKind.PropagationComplete])
+
+    def test_set_tiles_notifies_once_per_tile(self):
+        board = Board()
+        listener = CountingListener()
+        for row in board.tiles:
+            for tile in row:
+                tile.add_listener(listener)
+        board.set_tiles(["...26.7.1", "68..7..9.", "19...45..",
+                         "82.1...4.", "..46.29..", ".5...3.28",
+                         "..93...74", ".4..5..36", "7.3.18..."])
+        self.assertEqual(len(listener.counts), 36)
+        self.assertEqual(max(listener.counts.values()), 1)
+
+    def test_silent(self):
+        tile = Tile(0, 0)
+        listener = CountingListener()
+        tile.add_listener(listener)
+        Board.set_silent(True)
+        try:
+            tile.set_value("3")
+        finally:
+            Board.set_silent(False)
+        self.assertEqual(listener.counts, { })
+        tile.set_value("4")
+        self.assertEqual(listener.counts, {tile: 1})
 
 
 class TestConsistent(unittest.TestCase):
@@ -130,6 +226,18 @@ class TestConsistent(unittest.TestCase):
         board.set_tiles([".........", "......1..", "........1",
                          ".........", ".........", ".........",
                          ".........", ".........", "........."])
+        self.assertFalse(board.is_consistent())
+
+    def test_placed_tile_without_candidates(self):
+        """Consistency goes by values, not by what is left
+        of a placed tile's candidates.
+        """
+        board = Board()
+        board.set_tiles(["3........", ".........", ".........",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        board.tiles[0][0].remove_candidates(to_mask("3"))
+        self.assertTrue(board.is_consistent())
 
 
 class TestNakedSingle(unittest.TestCase):
@@ -164,6 +272,104 @@ class TestNakedSingle(unittest.TestCase):
                                     "519326874", "248957136", "763418259"]))
 
 
+class TestLockedCandidates(unittest.TestCase):
+
+    def test_pointing(self):
+        """In the top left block, 1 can only go on the top row,
+        so it cannot go elsewhere on the top row.
+        """
+        board = Board()
+        board.set_tiles([".........", "234......", "567......",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        self.assertTrue(board.tiles[0][5].could_be("1"))
+        self.assertTrue(board.locked_candidates())
+        self.assertFalse(board.tiles[0][5].could_be("1"))
+        self.assertTrue(board.tiles[0][1].could_be("1"))
+        self.assertTrue(board.tiles[3][5].could_be("1"))
+
+    def test_pointing_keeps_placed_tiles(self):
+        """A 1 already placed elsewhere on the top row keeps its
+        own candidate when the pointing 1 is crossed off the row.
+        """
+        board = Board()
+        board.set_tiles([".....1...", "234......", "567......",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        board.locked_candidates()
+        self.assertEqual(board.tiles[0][5].value, "1")
+        self.assertEqual(board.tiles[0][5].candidates, {"1"})
+        self.assertTrue(board.is_consistent())
+
+    def test_claiming(self):
+        """On the top row, 9 can only go in the top left block,
+        so it cannot go elsewhere in that block.
+        """
+        board = Board()
+        board.set_tiles(["...123456", ".........", ".........",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        board.naked_single()
+        self.assertTrue(board.tiles[1][1].could_be("9"))
+        self.assertTrue(board.locked_candidates())
+        self.assertFalse(board.tiles[1][1].could_be("9"))
+        self.assertTrue(board.tiles[0][1].could_be("9"))
+
+
+class TestNakedPairs(unittest.TestCase):
+
+    def test_pair_in_row(self):
+        """The two top left tiles can only be 1 or 2, so
+        nothing else on the top row (or in the block) can be.
+        """
+        board = Board()
+        board.set_tiles(["..3456...", "789......", ".........",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        board.naked_single()
+        self.assertEqual(board.tiles[0][0].candidates, {"1", "2"})
+        self.assertEqual(board.tiles[0][7].candidates,
+                         {"1", "2", "7", "8", "9"})
+        self.assertTrue(board.naked_pairs())
+        self.assertEqual(board.tiles[0][7].candidates, {"7", "8", "9"})
+        self.assertEqual(board.tiles[2][0].candidates, {"4", "5", "6"})
+        self.assertEqual(board.tiles[0][0].candidates, {"1", "2"})
+
+
+class TestPropagateStatus(unittest.TestCase):
+
+    def test_solved(self):
+        board = Board()
+        board.set_tiles(["...26.7.1", "68..7..9.", "19...45..",
+                         "82.1...4.", "..46.29..", ".5...3.28",
+                         "..93...74", ".4..5..36", "7.3.18..."])
+        self.assertEqual(board.propagate(), Status.SOLVED)
+
+    def test_ok(self):
+        board = Board()
+        board.set_tiles(["8........", "..36.....", ".7..9.2..",
+                         ".5...7...", "....457..", "...1...3.",
+                         "..1....68", "..85...1.", ".9....4.."])
+        self.assertEqual(board.propagate(), Status.OK)
+
+    def test_dead_no_candidates(self):
+        """Nothing can go in the top left corner"""
+        board = Board()
+        board.set_tiles([".12345...", "6........", "7........",
+                         "8........", "9........", ".........",
+                         ".........", ".........", "........."])
+        self.assertEqual(board.propagate(), Status.DEAD)
+
+    def test_dead_duplicate(self):
+        board = Board()
+        board.set_tiles(["1.......1", ".........", ".........",
+                         ".........", ".........", ".........",
+                         ".........", ".........", "........."])
+        self.assertEqual(board.propagate(), Status.DEAD)
+        board.tiles[0][8].set_value(UNKNOWN)
+        self.assertEqual(board.propagate(), Status.OK)
+
+
 class TestHiddenSingle(unittest.TestCase):
     """Test the Hidden Single tactic, which must be combined with the
     naked single tactic.
@@ -239,6 +445,25 @@ class TestHiddenSingle(unittest.TestCase):
         saved = board.as_list()
         self.assertEqual(tiles_list, saved)
 
+    def test_rollback(self):
+        """A failed search puts back values and candidates.
+        data/hardest.sdk with a wrong 2 added on the top row:
+        propagation alone does not see the clash, so every
+        guess has to be tried and undone.
+        """
+        board = Board()
+        board.set_tiles(["82.......", "..36.....", ".7..9.2..",
+                         ".5...7...", "....457..", "...1...3.",
+                         "..1....68", "..85...1.", ".9....4.."])
+        self.assertEqual(board.propagate(), Status.OK)
+        saved = board.as_list()
+        saved_candidates = [[tile.candidates for tile in row]
+                            for row in board.tiles]
+        self.assertFalse(board.solve())
+        self.assertEqual(board.as_list(), saved)
+        self.assertEqual([[tile.candidates for tile in row]
+                          for row in board.tiles], saved_candidates)
+
     def test_is_complete(self):
         board = Board()
         tiles_list = [